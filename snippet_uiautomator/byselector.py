@@ -37,6 +37,8 @@ class BySelector:
   https://developer.android.com/reference/androidx/test/uiautomator/BySelector
   """
 
+  __slots__ = ('_selector', '_bottom')
+
   SUBSELECTOR = (
       'ancestor',
       'child',
@@ -80,9 +82,19 @@ class BySelector:
     self._bottom = self._bottom[name]
 
   def copy(self) -> BySelector:
-    """Returns a copy of this selector."""
+    """Returns a copy of this selector that shares no sub-selector with it."""
     selector = BySelector(**self._selector)
-    selector._bottom = self._find_bottom_selector(selector._selector)  # pylint: disable=protected-access
+    bottom = selector._selector  # pylint: disable=protected-access
+    # Each level holds at most one sub-selector, so copying the chain is enough.
+    while True:
+      for name in bottom:
+        if name in self.SUBSELECTOR:
+          break
+      else:
+        break
+      bottom[name] = dict(bottom[name])
+      bottom = bottom[name]
+    selector._bottom = bottom  # pylint: disable=protected-access
     return selector
 
   def is_nested(self) -> bool:
@@ -19,6 +19,7 @@ import datetime
 import enum
 
 DEFAULT_UI_WAIT_TIME = datetime.timedelta(seconds=10)
+DEFAULT_UI_WAIT_TIME_MS = int(DEFAULT_UI_WAIT_TIME.total_seconds() * 1_000)
 DEFAULT_WAIT_FOR_SELECTOR_TIMEOUT = datetime.timedelta(seconds=0)
 
 
@@ -119,7 +119,7 @@ class _Wait:
     self._ui = ui
 
   def idle(
-      self, timeout: utils.TimeUnit = constants.DEFAULT_UI_WAIT_TIME
+      self, timeout: utils.TimeUnit = constants.DEFAULT_UI_WAIT_TIME_MS
   ) -> bool:
     """Waits for the current application to idle.
 
@@ -135,7 +135,7 @@ class _Wait:
   def update(
       self,
       package: Optional[str] = None,
-      timeout: utils.TimeUnit = constants.DEFAULT_UI_WAIT_TIME,
+      timeout: utils.TimeUnit = constants.DEFAULT_UI_WAIT_TIME_MS,
   ) -> bool:
     """Waits for a window content update event to occur.
 
@@ -273,11 +273,11 @@ class UiDevice:
 
   def find(self, **kwargs) -> Sequence[byselector.SelectorType]:
     """Finds all objects to match the selector criteria."""
-    return self._ui.findObjects((byselector.BySelector(**kwargs).to_dict()))
+    return self._ui.findObjects(kwargs)
 
   def has(self, **kwargs) -> bool:
     """Returns if there is a match for the given criteria."""
-    return self._ui.hasObject(byselector.BySelector(**kwargs).to_dict())
+    return self._ui.hasObject(kwargs)
 
   def clear_cache(self) -> bool:
     """Clears the accessibility cache, applicable to sdk 34 or higher."""
@@ -19,8 +19,10 @@ https://developer.android.com/reference/androidx/test/uiautomator/UiObject2
 
 from __future__ import annotations
 
+import functools
 from typing import Mapping, Optional, Sequence, Union
 
+from mobly.controllers import android_device
 from mobly.controllers.android_device_lib import snippet_client_v2
 from snippet_uiautomator import byselector
 from snippet_uiautomator import constants
@@ -31,13 +33,15 @@ from snippet_uiautomator import utils
 class _Click:
   """Performs a click action on a specific UiObject2."""
 
+  __slots__ = ('_ui', '_selector_dict')
+
   def __init__(
       self,
       ui: snippet_client_v2.SnippetClientV2,
       selector: byselector.BySelector,
   ) -> None:
     self._ui = ui
-    self._selector = selector
+    self._selector_dict = selector.to_dict()
 
   def __call__(self, timeout: Optional[utils.TimeUnit] = None) -> bool:
     """Clicks on this object.
@@ -49,26 +53,26 @@ class _Click:
       True if operation succeeds, False otherwise.
     """
     if timeout is None:
-      return self._ui.clickObj(self._selector.to_dict())
+      return self._ui.clickObj(self._selector_dict)
     timeout_ms = utils.covert_to_millisecond(timeout)
-    return self._ui.clickObj(self._selector.to_dict(), timeout_ms)
+    return self._ui.clickObj(self._selector_dict, timeout_ms)
 
   def bottomright(self) -> bool:
     """Clicks the lower right corner of this object."""
-    bounds = self._ui.getVisibleBounds(self._selector.to_dict())
+    bounds = self._ui.getVisibleBounds(self._selector_dict)
     if bounds is None:
       return False
     return self._ui.click(bounds['right'], bounds['bottom'])
 
   def topleft(self) -> bool:
     """Clicks the upper left corner of this object."""
-    bounds = self._ui.getVisibleBounds(self._selector.to_dict())
+    bounds = self._ui.getVisibleBounds(self._selector_dict)
     if bounds is None:
       return False
     return self._ui.click(bounds['left'], bounds['top'])
 
   def wait(
-      self, timeout: utils.TimeUnit = constants.DEFAULT_UI_WAIT_TIME
+      self, timeout: utils.TimeUnit = constants.DEFAULT_UI_WAIT_TIME_MS
   ) -> bool:
     """Clicks on this object and waits for window transitions.
 
@@ -80,20 +84,23 @@ class _Click:
       True if a window update occurred after clicked, False otherwise.
     """
     timeout_ms = utils.covert_to_millisecond(timeout)
-    return self._ui.clickObjAndWait(self._selector.to_dict(), timeout_ms)
+    return self._ui.clickObjAndWait(self._selector_dict, timeout_ms)
 
 
 class _Drag:
   """Performs a drag action on a specific UiObject2."""
 
+  __slots__ = ('_ui', '_device', '_selector_dict')
+
   def __init__(
       self,
       ui: snippet_client_v2.SnippetClientV2,
+      device: android_device.AndroidDevice,
       selector: byselector.BySelector,
   ) -> None:
     self._ui = ui
-    self._device = self._ui._device  # pylint: disable=protected-access
-    self._selector = selector
+    self._device = device
+    self._selector_dict = selector.to_dict()
 
   def __call__(
       self,
@@ -127,12 +134,12 @@ class _Drag:
     """
     if x is None and y is None and kwargs:
       return self._ui.dragObjToObj(
-          self._selector.to_dict(),
-          byselector.BySelector(**kwargs).to_dict(),
+          self._selector_dict,
+          kwargs,
           speed,
       )
     elif x is not None and y is not None and not kwargs:
-      return self._ui.dragObj(self._selector.to_dict(), x, y, speed)
+      return self._ui.dragObj(self._selector_dict, x, y, speed)
     else:
       raise errors.ApiError(
           'Drag to object and drag to coordinates cannot be mixed', self._device
@@ -142,35 +149,45 @@ class _Drag:
 class _Gesture:
   """Performs a gesture in a specific direction on a specific UiObject2."""
 
+  __slots__ = ('_ui', '_device', '_selector_dict', '_perform_gesture')
+
   def __init__(
       self,
       ui: snippet_client_v2.SnippetClientV2,
+      device: android_device.AndroidDevice,
       selector: byselector.BySelector,
       action: str,
   ) -> None:
     self._ui = ui
-    self._device = self._ui._device  # pylint: disable=protected-access
-    self._selector = selector
-    self._action = action
+    self._device = device
+    self._selector_dict = selector.to_dict()
+    # Stores the plain functions, as bound methods would refer back to self.
+    if action == 'fling':
+      self._perform_gesture = _Gesture._fling
+    elif action == 'swipe':
+      self._perform_gesture = _Gesture._swipe
+    else:
+      raise errors.ApiError(
+          f'Unknown gesture action: {repr(action)}', self._device
+      )
 
-  def _perform_gesture(
-      self, direction: str, percent: int, speed: Optional[int]
+  def _fling(
+      self, direction: constants.Direction, percent: int, speed: Optional[int]
   ) -> bool:
-    """Performs a gesture on this object."""
-    if self._action == 'fling':
-      if percent != 0:
-        raise errors.ApiError(
-            'fling gesture does not support changing the percent', self._device
-        )
-      return self._ui.fling(self._selector.to_dict(), direction, speed)
-    elif self._action == 'swipe':
-      return self._ui.swipeObj(
-          self._selector.to_dict(), direction, percent, speed
-      )
-    else:
+    """Performs a fling gesture on this object."""
+    if percent != 0:
       raise errors.ApiError(
-          f'Unknown gesture action: {repr(self._action)}', self._device
+          'fling gesture does not support changing the percent', self._device
       )
+    return self._ui.fling(self._selector_dict, direction.value, speed)
+
+  def _swipe(
+      self, direction: constants.Direction, percent: int, speed: Optional[int]
+  ) -> bool:
+    """Performs a swipe gesture on this object."""
+    return self._ui.swipeObj(
+        self._selector_dict, direction.value, percent, speed
+    )
 
   def down(self, percent: int = 0, speed: Optional[int] = None) -> bool:
     """Performs a gesture on this object with direction DOWN.
@@ -183,7 +200,7 @@ class _Gesture:
     Returns:
       True if operation succeeds, False otherwise.
     """
-    return self._perform_gesture('DOWN', percent, speed)
+    return self._perform_gesture(self, constants.Direction.DOWN, percent, speed)
 
   def left(self, percent: int = 0, speed: Optional[int] = None) -> bool:
     """Performs a gesture on this object with direction LEFT.
@@ -196,7 +213,7 @@ class _Gesture:
     Returns:
       True if operation succeeds, False otherwise.
     """
-    return self._perform_gesture('LEFT', percent, speed)
+    return self._perform_gesture(self, constants.Direction.LEFT, percent, speed)
 
   def right(self, percent: int = 0, speed: Optional[int] = None) -> bool:
     """Performs a gesture on this object with direction RIGHT.
@@ -209,7 +226,9 @@ class _Gesture:
     Returns:
       True if operation succeeds, False otherwise.
     """
-    return self._perform_gesture('RIGHT', percent, speed)
+    return self._perform_gesture(
+        self, constants.Direction.RIGHT, percent, speed
+    )
 
   def up(self, percent: int = 0, speed: Optional[int] = None) -> bool:
     """Performs a gesture on this object with direction UP.
@@ -222,19 +241,21 @@ class _Gesture:
     Returns:
       True if operation succeeds, False otherwise.
     """
-    return self._perform_gesture('UP', percent, speed)
+    return self._perform_gesture(self, constants.Direction.UP, percent, speed)
 
 
 class _Pinch:
   """Performs a pinch gesture on a specific UiObject2."""
 
+  __slots__ = ('_ui', '_selector_dict')
+
   def __init__(
       self,
       ui: snippet_client_v2.SnippetClientV2,
       selector: byselector.BySelector,
   ) -> None:
     self._ui = ui
-    self._selector = selector
+    self._selector_dict = selector.to_dict()
 
   def close(self, percent: int, speed: Optional[int] = None) -> bool:
     """Performs a pinch close gesture on this object.
@@ -246,8 +267,7 @@ class _Pinch:
     Returns:
       True if operation succeeds, False otherwise.
     """
-    selector_dict = self._selector.to_dict()
-    return self._ui.pinchClose(selector_dict, percent, speed)
+    return self._ui.pinchClose(self._selector_dict, percent, speed)
 
   def open(self, percent: int, speed: Optional[int] = None) -> bool:
     """Performs a pinch open gesture on this object.
@@ -259,27 +279,38 @@ class _Pinch:
     Returns:
       True if operation succeeds, False otherwise.
     """
-    selector_dict = self._selector.to_dict()
-    return self._ui.pinchOpen(selector_dict, percent, speed)
+    return self._ui.pinchOpen(self._selector_dict, percent, speed)
 
 
 class _Scroll:
   """Performs a scroll action on a specific UiObject2."""
 
+  __slots__ = ('_ui', '_device', '_selector', '_margin', '_percent')
+
   class _To:
     """Scrolls from this object to specific position or object."""
 
+    __slots__ = (
+        '_ui',
+        '_device',
+        '_selector_dict',
+        '_direction',
+        '_margin',
+        '_percent',
+    )
+
     def __init__(
         self,
         ui: snippet_client_v2.SnippetClientV2,
+        device: android_device.AndroidDevice,
         selector: byselector.BySelector,
-        direction: str,
+        direction: constants.Direction,
         margin: Optional[int],
         percent: Optional[int],
     ) -> None:
       self._ui = ui
-      self._device = self._ui._device  # pylint: disable=protected-access
-      self._selector = selector
+      self._device = device
+      self._selector_dict = selector.to_dict()
       self._direction = direction
       self._margin = margin
       self._percent = percent
@@ -307,21 +338,21 @@ class _Scroll:
       if percent is None and speed is None:
         if kwargs:
           return self._ui.scrollUntil(
-              self._selector.to_dict(),
+              self._selector_dict,
               kwargs,
-              self._direction,
+              self._direction.value,
               self._margin,
               self._percent,
           )
         return self._ui.scrollUntilFinished(
-            self._selector.to_dict(),
-            self._direction,
+            self._selector_dict,
+            self._direction.value,
             self._margin,
             self._percent,
         )
       elif percent is not None and not kwargs:
         return self._ui.scroll(
-            self._selector.to_dict(), self._direction, percent, speed
+            self._selector_dict, self._direction.value, percent, speed
         )
       else:
         raise errors.ApiError(
@@ -342,10 +373,11 @@ class _Scroll:
   def __init__(
       self,
       ui: snippet_client_v2.SnippetClientV2,
+      device: android_device.AndroidDevice,
       selector: byselector.BySelector,
   ) -> None:
     self._ui = ui
-    self._device = self._ui._device  # pylint: disable=protected-access
+    self._device = device
     self._selector = selector
     self._margin = None
     self._percent = None
@@ -363,49 +395,57 @@ class _Scroll:
     self._percent = percent
     return self
 
+  def _scroll_to(self, direction: constants.Direction) -> _Scroll._To:
+    """Creates the scroll gesture in the given direction."""
+    return self._To(
+        self._ui,
+        self._device,
+        self._selector,
+        direction,
+        self._margin,
+        self._percent,
+    )
+
   @property
   def down(self) -> _Scroll._To:
     """Performs a scroll gesture on this object with direction DOWN."""
-    return self._To(
-        self._ui, self._selector, 'DOWN', self._margin, self._percent
-    )
+    return self._scroll_to(constants.Direction.DOWN)
 
   @property
   def left(self) -> _Scroll._To:
     """Performs a scroll gesture on this object with direction LEFT."""
-    return self._To(
-        self._ui, self._selector, 'LEFT', self._margin, self._percent
-    )
+    return self._scroll_to(constants.Direction.LEFT)
 
   @property
   def right(self) -> _Scroll._To:
     """Performs a scroll gesture on this object with direction RIGHT."""
-    return self._To(
-        self._ui, self._selector, 'RIGHT', self._margin, self._percent
-    )
+    return self._scroll_to(constants.Direction.RIGHT)
 
   @property
   def up(self) -> _Scroll._To:
     """Performs a scroll gesture on this object with direction UP."""
-    return self._To(self._ui, self._selector, 'UP', self._margin, self._percent)
+    return self._scroll_to(constants.Direction.UP)
 
 
 class _Wait:
   """Waits for a specific UiObject2 to appear or disappear."""
 
+  __slots__ = ('_ui', '_device', '_selector_dict', '_raise_error')
+
   def __init__(
       self,
       ui: snippet_client_v2.SnippetClientV2,
+      device: android_device.AndroidDevice,
       selector: byselector.BySelector,
       raise_error: bool = False,
   ) -> None:
     self._ui = ui
-    self._device = self._ui._device  # pylint: disable=protected-access
-    self._selector = selector
+    self._device = device
+    self._selector_dict = selector.to_dict()
     self._raise_error = raise_error
 
   def click(
-      self, timeout: utils.TimeUnit = constants.DEFAULT_UI_WAIT_TIME
+      self, timeout: utils.TimeUnit = constants.DEFAULT_UI_WAIT_TIME_MS
   ) -> bool:
     """Waits for this object to appear, then clicks.
 
@@ -416,13 +456,13 @@ class _Wait:
       True if the object exists and click successfully, False otherwise.
     """
     timeout_ms = utils.covert_to_millisecond(timeout)
-    if self._ui.waitForExists(self._selector.to_dict(), timeout_ms):
-      return self._ui.clickObj(self._selector.to_dict())
+    if self._ui.waitForExists(self._selector_dict, timeout_ms):
+      return self._ui.clickObj(self._selector_dict)
     return False
 
   def exists(
       self,
-      timeout: utils.TimeUnit = constants.DEFAULT_UI_WAIT_TIME,
+      timeout: utils.TimeUnit = constants.DEFAULT_UI_WAIT_TIME_MS,
       raise_error: bool = False,
   ) -> bool:
     """Waits for this object to appear.
@@ -436,19 +476,19 @@ class _Wait:
       True if this object exists, False otherwise.
     """
     timeout_ms = utils.covert_to_millisecond(timeout)
-    is_exists = self._ui.waitForExists(self._selector.to_dict(), timeout_ms)
+    is_exists = self._ui.waitForExists(self._selector_dict, timeout_ms)
     if is_exists:
       return True
     if self._raise_error or raise_error:
       raise errors.UiObjectSearchError(
-          f'Not found Selector{self._selector.to_dict()} over {timeout_ms} ms',
+          f'Not found Selector{self._selector_dict} over {timeout_ms} ms',
           self._device,
       )
     return False
 
   def gone(
       self,
-      timeout: utils.TimeUnit = constants.DEFAULT_UI_WAIT_TIME,
+      timeout: utils.TimeUnit = constants.DEFAULT_UI_WAIT_TIME_MS,
       raise_error: bool = False,
   ) -> bool:
     """Waits for this object to disappear.
@@ -462,13 +502,12 @@ class _Wait:
       True if this object was not found, False otherwise.
     """
     timeout_ms = utils.covert_to_millisecond(timeout)
-    is_gone = self._ui.waitUntilGone(self._selector.to_dict(), timeout_ms)
+    is_gone = self._ui.waitUntilGone(self._selector_dict, timeout_ms)
     if is_gone:
       return True
     if self._raise_error or raise_error:
       raise errors.UiObjectSearchError(
-          f'Still found Selector{self._selector.to_dict()} over'
-          f' {timeout_ms} ms',
+          f'Still found Selector{self._selector_dict} over {timeout_ms} ms',
           self._device,
       )
     return False
@@ -489,6 +528,7 @@ class UiObject2:
     self._ui = ui
     self._device = self._ui._device  # pylint: disable=protected-access
     self._selector = selector
+    self._selector_dict = selector.to_dict()
     self._raise_error = raise_error
 
   def _create_instance(self, tag: str, **kwargs) -> UiObject2:
@@ -532,64 +572,60 @@ class UiObject2:
 
   def clear_text(self) -> bool:
     """Clears the text content if this object is an editable field."""
-    return self._ui.clear(self._selector.to_dict())
+    return self._ui.clear(self._selector_dict)
 
   def find(self, **kwargs) -> Sequence[byselector.SelectorType]:
     """Finds all objects under this object to match the selector criteria."""
-    return self._ui.findChildObjects(
-        self._selector.to_dict(), byselector.BySelector(**kwargs).to_dict()
-    )
+    return self._ui.findChildObjects(self._selector_dict, kwargs)
 
   def has(self, **kwargs) -> bool:
     """Returns if there is a match for the given criteria under this object."""
-    return self._ui.hasChildObject(
-        self._selector.to_dict(), byselector.BySelector(**kwargs).to_dict()
-    )
+    return self._ui.hasChildObject(self._selector_dict, kwargs)
 
   def long_click(self) -> bool:
     """Performs a long click on this object."""
-    return self._ui.longClick(self._selector.to_dict())
+    return self._ui.longClick(self._selector_dict)
 
   def set_text(self, text: str) -> bool:
     """Sets the text content if this object is an editable field."""
-    return self._ui.setText(self._selector.to_dict(), text)
+    return self._ui.setText(self._selector_dict, text)
 
   @property
   def children(self) -> Sequence[byselector.SelectorType]:
     """The child objects directly under this object."""
-    return self._ui.getChildren(self._selector.to_dict())
+    return self._ui.getChildren(self._selector_dict)
 
-  @property
+  @functools.cached_property
   def click(self) -> _Click:
     """Clicks on this object."""
     return _Click(self._ui, self._selector)
 
-  @property
+  @functools.cached_property
   def drag(self) -> _Drag:
     """Drags this object to the specified location."""
-    return _Drag(self._ui, self._selector)
+    return _Drag(self._ui, self._device, self._selector)
 
   @property
   def exists(self) -> bool:
     """Checks if the this UI object exists."""
-    is_exists = self._ui.exists(self._selector.to_dict())
+    is_exists = self._ui.exists(self._selector_dict)
     if not is_exists and self._raise_error:
       raise errors.UiObjectSearchError(
-          f'Not found Selector{self._selector.to_dict()}', self._device
+          f'Not found Selector{self._selector_dict}', self._device
       )
     return is_exists
 
-  @property
+  @functools.cached_property
   def fling(self) -> _Gesture:
     """Performs a fling gesture on this object."""
-    return _Gesture(self._ui, self._selector, 'fling')
+    return _Gesture(self._ui, self._device, self._selector, 'fling')
 
   @property
   def info(self) -> Mapping[str, Union[bool, int, str, Mapping[str, int]]]:
     """Returns all properties of the UI element."""
-    return self._ui.getObjInfo(self._selector.to_dict())
+    return self._ui.getObjInfo(self._selector_dict)
 
-  @property
+  @functools.cached_property
   def pinch(self) -> _Pinch:
     """Performs a pinch gesture on this object."""
     return _Pinch(self._ui, self._selector)
@@ -597,111 +633,111 @@ class UiObject2:
   @property
   def scroll(self) -> _Scroll:
     """Performs a scroll gesture on this object."""
-    return _Scroll(self._ui, self._selector)
+    return _Scroll(self._ui, self._device, self._selector)
 
-  @property
+  @functools.cached_property
   def swipe(self) -> _Gesture:
     """Performs a swipe gesture on this object."""
-    return _Gesture(self._ui, self._selector, 'swipe')
+    return _Gesture(self._ui, self._device, self._selector, 'swipe')
 
-  @property
+  @functools.cached_property
   def wait(self) -> _Wait:
     """Performs wait action on this object."""
-    return _Wait(self._ui, self._selector, self._raise_error)
+    return _Wait(self._ui, self._device, self._selector, self._raise_error)
 
   @property
   def count(self) -> int:
     """The number of objects that match this selector criteria."""
-    return len(self._ui.findObjects(self._selector.to_dict()))
+    return len(self._ui.findObjects(self._selector_dict))
 
   @property
   def display_id(self) -> int:
     """The ID of the display containing this object."""
-    return self._ui.getDisplayId(self._selector.to_dict())
+    return self._ui.getDisplayId(self._selector_dict)
 
   @property
   def class_name(self) -> str:
     """The class name of this object."""
-    return self._ui.getClassName(self._selector.to_dict())
+    return self._ui.getClassName(self._selector_dict)
 
   @property
   def description(self) -> str:
     """The content description for this object."""
-    return self._ui.getContentDescription(self._selector.to_dict())
+    return self._ui.getContentDescription(self._selector_dict)
 
   @property
   def hint(self) -> str:
     """The hint text of this object."""
-    return self._ui.getHint(self._selector.to_dict())
+    return self._ui.getHint(self._selector_dict)
 
   @property
   def package_name(self) -> str:
     """The package name of the app that this object belongs to."""
-    return self._ui.getApplicationPackage(self._selector.to_dict())
+    return self._ui.getApplicationPackage(self._selector_dict)
 
   @property
   def resource_id(self) -> str:
     """The fully qualified resource name for this object's id."""
-    return self._ui.getResourceName(self._selector.to_dict())
+    return self._ui.getResourceName(self._selector_dict)
 
   @property
   def text(self) -> str:
     """The text value for this object."""
-    return self._ui.getText(self._selector.to_dict())
+    return self._ui.getText(self._selector_dict)
 
   @property
   def checkable(self) -> bool:
     """Whether this object is checkable."""
-    return self._ui.isCheckable(self._selector.to_dict())
+    return self._ui.isCheckable(self._selector_dict)
 
   @property
   def checked(self) -> bool:
     """Whether this object is checked."""
-    return self._ui.isChecked(self._selector.to_dict())
+    return self._ui.isChecked(self._selector_dict)
 
   @property
   def clickable(self) -> bool:
     """Whether this object is clickable."""
-    return self._ui.isClickable(self._selector.to_dict())
+    return self._ui.isClickable(self._selector_dict)
 
   @property
   def enabled(self) -> bool:
     """Whether this object is enabled."""
-    return self._ui.isEnabled(self._selector.to_dict())
+    return self._ui.isEnabled(self._selector_dict)
 
   @property
   def focusable(self) -> bool:
     """Whether this object is focusable."""
-    return self._ui.isFocusable(self._selector.to_dict())
+    return self._ui.isFocusable(self._selector_dict)
 
   @property
   def focused(self) -> bool:
     """Whether this object is focused."""
-    return self._ui.isFocused(self._selector.to_dict())
+    return self._ui.isFocused(self._selector_dict)
 
   @property
   def long_clickable(self) -> bool:
     """Whether this object is long clickable."""
-    return self._ui.isLongClickable(self._selector.to_dict())
+    return self._ui.isLongClickable(self._selector_dict)
 
   @property
   def scrollable(self) -> bool:
     """Whether this object is scrollable."""
-    return self._ui.isScrollable(self._selector.to_dict())
+    return self._ui.isScrollable(self._selector_dict)
 
   @property
   def selected(self) -> bool:
     """Whether this object is selected."""
-    return self._ui.isSelected(self._selector.to_dict())
+    return self._ui.isSelected(self._selector_dict)
 
   @property
   def visible_bounds(self) -> constants.Rect:
     """This object's visible bounds."""
-    rect = self._ui.getVisibleBounds(self._selector.to_dict())
+    rect = self._ui.getVisibleBounds(self._selector_dict)
     return constants.Rect(**rect)
 
   @property
   def visible_center(self) -> constants.Point:
     """The point in the center of this object's visible bounds."""
-    point = self._ui.getVisibleCenter(self._selector.to_dict())
+    point = self._ui.getVisibleCenter(self._selector_dict)
     return constants.Point(**point)
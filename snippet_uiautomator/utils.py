@@ -33,6 +33,8 @@ TimeUnit = Union[float, int, datetime.timedelta]
 
 def covert_to_millisecond(timeout: TimeUnit) -> int:
   """Converts a time unit object to an integer in milliseconds."""
+  if type(timeout) is int:  # pylint: disable=unidiomatic-typecheck
+    return timeout
   if isinstance(timeout, datetime.timedelta):
     return int(timeout.total_seconds() * 1_000)
   return int(timeout)
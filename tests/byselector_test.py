@@ -0,0 +1,58 @@
+# Copyright 2023 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for snippet_uiautomator.byselector."""
+
+import pytest
+from snippet_uiautomator import byselector
+
+
+def test_append_succeeds():
+  selector = byselector.BySelector(text='A')
+
+  selector.append('child', text='B')
+  selector.append('sibling', text='C')
+
+  assert selector.to_dict() == {
+      'text': 'A',
+      'child': {'text': 'B', 'sibling': {'text': 'C'}},
+  }
+  assert selector.is_nested()
+
+
+@pytest.mark.parametrize(
+    'name,kwargs',
+    [
+        ('unknown', {'text': 'B'}),
+        ('child', {'parent': {'text': 'B'}}),
+    ],
+)
+def test_append_with_incorrect_selector_fails(name, kwargs):
+  selector = byselector.BySelector(text='A')
+
+  with pytest.raises(byselector.SelectorError):
+    selector.append(name, **kwargs)
+
+
+def test_copy_does_not_change_original_selector():
+  selector = byselector.BySelector(text='A')
+  selector.append('child', text='B')
+
+  selector_copy = selector.copy()
+  selector_copy.append('child', text='C')
+
+  assert selector.to_dict() == {'text': 'A', 'child': {'text': 'B'}}
+  assert selector_copy.to_dict() == {
+      'text': 'A',
+      'child': {'text': 'B', 'child': {'text': 'C'}},
+  }
@@ -0,0 +1,125 @@
+# Copyright 2023 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for snippet_uiautomator.uiobject2."""
+
+import datetime
+from unittest import mock
+
+import pytest
+from snippet_uiautomator import byselector
+from snippet_uiautomator import errors
+from snippet_uiautomator import uiobject2
+
+
+def test_scroll_click_succeeds():
+  mock_ui = mock.Mock()
+  obj = uiobject2.UiObject2(mock_ui, byselector.BySelector(scrollable=True))
+
+  is_clicked = obj.scroll(margin=10).down.click(text='Example')
+
+  mock_ui.scrollUntil.assert_called_once_with(
+      {'scrollable': True}, {'text': 'Example'}, 'DOWN', 10, None
+  )
+  mock_ui.clickObj.assert_called_once_with({'text': 'Example'})
+  assert is_clicked is mock_ui.clickObj.return_value
+
+
+def test_wait_click_succeeds():
+  mock_ui = mock.Mock()
+  obj = uiobject2.UiObject2(mock_ui, byselector.BySelector(text='Example'))
+
+  is_clicked = obj.wait.click(datetime.timedelta(seconds=3))
+
+  mock_ui.waitForExists.assert_called_once_with({'text': 'Example'}, 3000)
+  mock_ui.clickObj.assert_called_once_with({'text': 'Example'})
+  assert is_clicked is mock_ui.clickObj.return_value
+
+
+def test_action_helpers_are_reused():
+  obj = uiobject2.UiObject2(mock.Mock(), byselector.BySelector(text='Example'))
+
+  assert obj.click is obj.click
+  assert obj.fling is not obj.swipe
+  assert obj.scroll is not obj.scroll
+
+
+def test_count_succeeds():
+  mock_ui = mock.Mock()
+  mock_ui.findObjects.return_value = [{}, {}, {}]
+  obj = uiobject2.UiObject2(mock_ui, byselector.BySelector(text='Example'))
+
+  count = obj.count
+
+  mock_ui.findObjects.assert_called_once_with({'text': 'Example'})
+  assert count == 3
+
+
+@pytest.mark.parametrize(
+    'method,x,y',
+    [
+        ('bottomright', 340, 1402),
+        ('topleft', 198, 1343),
+    ],
+)
+def test_click_corner_succeeds(method, x, y):
+  mock_ui = mock.Mock()
+  mock_ui.getVisibleBounds.return_value = {
+      'left': 198,
+      'top': 1343,
+      'right': 340,
+      'bottom': 1402,
+  }
+  obj = uiobject2.UiObject2(mock_ui, byselector.BySelector(text='Example'))
+
+  is_clicked = getattr(obj.click, method)()
+
+  mock_ui.getVisibleBounds.assert_called_once_with({'text': 'Example'})
+  mock_ui.click.assert_called_once_with(x, y)
+  assert is_clicked is mock_ui.click.return_value
+
+
+def test_click_corner_of_missing_object_fails():
+  mock_ui = mock.Mock()
+  mock_ui.getVisibleBounds.return_value = None
+  obj = uiobject2.UiObject2(mock_ui, byselector.BySelector(text='Example'))
+
+  assert not obj.click.bottomright()
+  mock_ui.click.assert_not_called()
+
+
+def test_swipe_succeeds():
+  mock_ui = mock.Mock()
+  obj = uiobject2.UiObject2(mock_ui, byselector.BySelector(text='Example'))
+
+  is_swiped = obj.swipe.left(percent=50, speed=100)
+
+  mock_ui.swipeObj.assert_called_once_with({'text': 'Example'}, 'LEFT', 50, 100)
+  assert is_swiped is mock_ui.swipeObj.return_value
+
+
+def test_fling_with_percent_fails():
+  mock_ui = mock.Mock()
+  obj = uiobject2.UiObject2(mock_ui, byselector.BySelector(text='Example'))
+
+  with pytest.raises(errors.ApiError, match='does not support'):
+    obj.fling.down(percent=50)
+  mock_ui.fling.assert_not_called()
+
+
+def test_gesture_with_unknown_action_fails():
+  mock_ui = mock.Mock()
+  selector = byselector.BySelector(text='Example')
+
+  with pytest.raises(errors.ApiError, match='Unknown gesture action'):
+    uiobject2._Gesture(mock_ui, mock_ui._device, selector, 'drag')  # pylint: disable=protected-access